@@ -0,0 +1,287 @@
+"""
+SolarScan Geocoding Service
+주소 -> 좌표 변환 전용 서비스 (Kakao Local API + Redis 캐시)
+"""
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+from typing import Optional, List, Dict, Annotated
+from contextlib import asynccontextmanager
+from redis.exceptions import RedisError
+import redis.asyncio as aioredis
+import httpx
+import orjson
+import asyncio
+import hashlib
+import os
+import logging
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 외부 API 설정
+KAKAO_REST_API_KEY = os.getenv("KAKAO_REST_API_KEY", "")
+KAKAO_ADDRESS_SEARCH_URL = "https://dapi.kakao.com/v2/local/search/address.json"
+KAKAO_TIMEOUT = 5.0  # 초 (API 서버의 GEO_SERVICE_TIMEOUT보다 짧아야 502가 전달됨)
+
+# 캐시 설정
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+GEOCODE_CACHE_TTL = 60 * 60 * 24 * 30  # 30일
+
+# 공유 HTTP 클라이언트 / Redis 클라이언트 (lifespan에서 생성/종료, 커넥션 풀 재사용)
+_http: Optional[httpx.AsyncClient] = None
+_redis: Optional[aioredis.Redis] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 공유 리소스 관리"""
+    global _http, _redis
+    _http = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        http2=True,
+        timeout=KAKAO_TIMEOUT
+    )
+    _redis = aioredis.Redis.from_url(REDIS_URL)
+    try:
+        yield
+    finally:
+        await _http.aclose()
+        await _redis.aclose()
+        _http = None
+        _redis = None
+
+
+# FastAPI 앱 생성
+app = FastAPI(
+    title="SolarScan Geocoding Service",
+    description="주소 좌표 변환 내부 서비스",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# ==================== Request/Response Models ====================
+
+class GeocodeRequest(BaseModel):
+    """단일 주소 변환 요청"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
+    address: str = Field(..., min_length=1, description="변환할 주소")
+
+
+class BulkGeocodeRequest(BaseModel):
+    """여러 주소 일괄 변환 요청"""
+    addresses: List[Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="변환할 주소 목록 (최대 100개)"
+    )
+
+
+class Location(BaseModel):
+    """위치 정보"""
+    address: str
+    latitude: float
+    longitude: float
+    region: str  # 시/도 시/군/구
+    region_code: str  # 시/도 법정동 코드 (예: 41 = 경기도)
+
+
+class BulkGeocodeResponse(BaseModel):
+    """일괄 변환 결과 (입력 순서 유지, 실패 시 null)"""
+    results: List[Optional[Location]]
+
+
+# ==================== Helper Functions ====================
+
+# Kakao 주소 검색은 시/도를 약칭으로 반환 (예: "경기")
+# 약칭 -> (정식 명칭, 시/도 법정동 코드)
+SIDO_INFO = {
+    "서울": ("서울특별시", "11"),
+    "부산": ("부산광역시", "26"),
+    "대구": ("대구광역시", "27"),
+    "인천": ("인천광역시", "28"),
+    "광주": ("광주광역시", "29"),
+    "대전": ("대전광역시", "30"),
+    "울산": ("울산광역시", "31"),
+    "세종": ("세종특별자치시", "36"),
+    "경기": ("경기도", "41"),
+    "충북": ("충청북도", "43"),
+    "충남": ("충청남도", "44"),
+    "전남": ("전라남도", "46"),
+    "경북": ("경상북도", "47"),
+    "경남": ("경상남도", "48"),
+    "제주": ("제주특별자치도", "50"),
+    "강원": ("강원특별자치도", "51"),
+    "전북": ("전북특별자치도", "52")
+}
+
+
+def _geocode_cache_key(address: str) -> str:
+    """정규화된 주소 기반 지오코딩 캐시 키"""
+    normalized = " ".join(address.split()).lower()
+    return "geo:v2:" + hashlib.sha1(normalized.encode()).hexdigest()
+
+
+async def geocode_address(address: str) -> Optional[Dict]:
+    """
+    주소를 좌표로 변환 (Redis 캐시 우선, 없으면 Kakao API 호출)
+    Redis 장애 시에는 캐시 없이 API 호출로 진행
+    """
+    key = _geocode_cache_key(address)
+    
+    try:
+        cached = await _redis.get(key)
+        if cached:
+            return orjson.loads(cached)
+    except RedisError as e:
+        logger.warning(f"Geocode cache read failed: {str(e)}")
+    
+    result = await _geocode_kakao(address)
+    
+    if result:
+        try:
+            await _redis.set(key, orjson.dumps(result), ex=GEOCODE_CACHE_TTL)
+        except RedisError as e:
+            logger.warning(f"Geocode cache write failed: {str(e)}")
+    
+    return result
+
+
+async def geocode_addresses_bulk(addresses: List[str]) -> List[Optional[Dict]]:
+    """
+    여러 주소를 한 번에 좌표로 변환 (입력 순서 유지)
+    정규화 기준으로 중복 제거 후 Redis MGET 한 번으로 캐시 조회, 나머지만 Kakao API 동시 호출
+    """
+    # 캐시 키 -> 대표 주소 (중복 제거)
+    key_to_address: Dict[str, str] = {}
+    for address in addresses:
+        key_to_address.setdefault(_geocode_cache_key(address), address)
+    keys = list(key_to_address)
+    
+    results: Dict[str, Optional[Dict]] = {}
+    
+    try:
+        for key, cached in zip(keys, await _redis.mget(keys)):
+            if cached:
+                results[key] = orjson.loads(cached)
+    except RedisError as e:
+        logger.warning(f"Geocode cache read failed: {str(e)}")
+    
+    missing = [key for key in keys if key not in results]
+    fetched = await asyncio.gather(
+        *(_geocode_kakao(key_to_address[key]) for key in missing)
+    )
+    results.update(zip(missing, fetched))
+    
+    to_cache = [(key, result) for key, result in zip(missing, fetched) if result]
+    if to_cache:
+        try:
+            async with _redis.pipeline(transaction=False) as pipe:
+                for key, result in to_cache:
+                    pipe.set(key, orjson.dumps(result), ex=GEOCODE_CACHE_TTL)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Geocode cache write failed: {str(e)}")
+    
+    return [results[_geocode_cache_key(address)] for address in addresses]
+
+
+async def _geocode_kakao(address: str) -> Optional[Dict]:
+    """
+    Kakao Local API 주소 검색
+    검색 결과가 없으면 None 반환
+    """
+    resp = await _http.get(
+        KAKAO_ADDRESS_SEARCH_URL,
+        params={"query": address},
+        headers={"Authorization": f"KakaoAK {KAKAO_REST_API_KEY}"}
+    )
+    resp.raise_for_status()
+    
+    documents = resp.json().get("documents", [])
+    if not documents:
+        return None
+    
+    doc = documents[0]
+    detail = doc.get("address") or doc.get("road_address") or {}
+    sido = detail.get("region_1depth_name", "")
+    sido_name, sido_code = SIDO_INFO.get(sido, (sido, ""))
+    region = " ".join(
+        name for name in (sido_name, detail.get("region_2depth_name", "")) if name
+    )
+    
+    # 시/도 코드는 법정동 코드(b_code) 앞 2자리 우선, 없으면 시/도 약칭으로 조회
+    b_code = detail.get("b_code", "")
+    region_code = b_code[:2] if b_code else sido_code
+    
+    return {
+        "address": doc.get("address_name", address),
+        "latitude": float(doc["y"]),
+        "longitude": float(doc["x"]),
+        "region": region,
+        "region_code": region_code
+    }
+
+
+# ==================== API Endpoints ====================
+
+@app.get("/health")
+async def health_check():
+    """헬스 체크"""
+    return {"status": "healthy"}
+
+
+@app.post("/geocode", response_model=None, responses={200: {"model": Location}})
+async def geocode(request: GeocodeRequest):
+    """
+    주소 -> 좌표 변환
+    
+    Returns:
+        - 위치 정보 (검색 결과가 없으면 404)
+    """
+    try:
+        result = await geocode_address(request.address)
+    except httpx.HTTPError as e:
+        logger.error(f"Kakao geocoding failed: {str(e)}")
+        raise HTTPException(status_code=502, detail="Geocoding provider error")
+    
+    if not result:
+        raise HTTPException(status_code=404, detail="Address not found")
+    
+    return ORJSONResponse(result)
+
+
+@app.post(
+    "/geocode/bulk",
+    response_model=None,
+    responses={200: {"model": BulkGeocodeResponse}}
+)
+async def geocode_bulk(request: BulkGeocodeRequest):
+    """
+    여러 주소 일괄 변환
+    
+    Returns:
+        - results: 입력 순서대로 위치 정보 (검색 결과가 없으면 null)
+    """
+    try:
+        results = await geocode_addresses_bulk(request.addresses)
+    except httpx.HTTPError as e:
+        logger.error(f"Kakao geocoding failed: {str(e)}")
+        raise HTTPException(status_code=502, detail="Geocoding provider error")
+    
+    return ORJSONResponse({"results": results})
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8001,
+        log_level="info"
+    )